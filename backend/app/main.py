@@ -79,7 +79,7 @@ async def upload_statement(
         raise HTTPException(status_code=404, detail=f"Client with ID {client_id} not found")
     
     # Create uploads directory if it doesn't exist
-    uploads_dir = "data/uploads"
+    uploads_dir = os.getenv("UPLOAD_DIR", "data/uploads")
     os.makedirs(uploads_dir, exist_ok=True)
     
     # Generate timestamp-based filename
@@ -3,33 +3,287 @@ import pandas as pd
 import numpy as np
 from PIL import Image
 import pytesseract
-import camelot
-import tempfile
 import os
+import atexit
+import multiprocessing
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import logging
 
+# Keep OCR table cells in Arrow-backed string columns (one contiguous buffer per
+# column instead of a Python object per cell) when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401  (provides pandas' 'string[pyarrow]' dtype)
+    _CELL_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _CELL_DTYPE = object
+
+# Prefer tesserocr's in-process binding to the Tesseract API, which avoids a
+# subprocess spawn and TSV round-trip per image; pytesseract is the fallback.
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 logger = logging.getLogger(__name__)
 
+# One tesserocr API per thread: an instance is not safe to share, and
+# recognition releases the GIL so threads can OCR concurrently
+_tesseract_local = threading.local()
+
+# Language data for tesserocr; without it tesserocr looks in its build-time
+# default, which pip wheels leave as the working directory
+_TESSDATA_PATH = os.environ.get('TESSDATA_PREFIX')
+
+# Set once tesserocr fails to initialise (e.g. no tessdata), so every later
+# call goes straight to pytesseract instead of retrying and re-logging
+_tesserocr_failed = False
+
+# Tesseract variables for table crops only: skip the inverted text pass and the
+# word dictionaries, which slow down and rarely help on the numbers, dates and
+# reference codes that make up statement tables. Full-page text keeps the
+# defaults, since the parser mines it for payees and descriptions.
+_TESSERACT_VARIABLES = {
+    'tessedit_do_invert': '0',
+    'load_system_dawg': 'F',
+    'load_freq_dawg': 'F',
+}
+_VARIABLES_CONFIG = ' '.join(f'-c {name}={value}' for name, value in _TESSERACT_VARIABLES.items())
+
+# LSTM engine only (skips loading the legacy model); table crops are read as a
+# single uniform block of text, whole pages keep automatic segmentation
+_TABLE_OCR_CONFIG = f'--oem 1 --psm 6 {_VARIABLES_CONFIG}'
+_PAGE_OCR_CONFIG = '--oem 1'
+
+# Page rendering resolution: text at _REFERENCE_FONT_SIZE points needs the full
+# default DPI, larger type is rendered proportionally lower down to the minimum
+_DEFAULT_RESOLUTION = 300
+_MIN_RESOLUTION = 150
+_REFERENCE_FONT_SIZE = 10.0
+
+# Pages rendered ahead of OCR when a document is processed in-process
+_RENDER_AHEAD = 2
+
+# Worker pools for multi-page table extraction, keyed by size and created on
+# first use. Workers are spawned rather than forked so they never inherit a
+# thread's tesserocr engine or the render thread's state.
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+# Table metadata for recently inspected PDFs, least recently used first
+_METADATA_CACHE_SIZE = 128
+_table_metadata_cache: 'OrderedDict[Tuple[str, str, int, int], List[Dict[str, Any]]]' = OrderedDict()
+# Guards cache lookups and updates; never held while OCR runs
+_table_metadata_lock = threading.Lock()
+
+
+def _get_thread_api(name: str, variables: Dict[str, str]):
+    """
+    Get this thread's tesserocr API of the given kind, creating it on first use.
+    
+    The engine, language and variables are set once here, so each image only
+    costs a SetImage and recognition rather than a re-parse of the config.
+    
+    Args:
+        name: Thread-local attribute the API is kept under
+        variables: Tesseract variables to initialise the engine with
+        
+    Returns:
+        tesserocr.PyTessBaseAPI instance, or None if tesserocr is not installed
+        or cannot be initialised
+    """
+    global _tesserocr_failed
+    if tesserocr is None or _tesserocr_failed:
+        return None
+    
+    api = getattr(_tesseract_local, name, None)
+    if api is None:
+        kwargs = {'path': _TESSDATA_PATH} if _TESSDATA_PATH else {}
+        try:
+            api = tesserocr.PyTessBaseAPI(
+                lang='eng', oem=tesserocr.OEM.LSTM_ONLY, variables=variables, **kwargs
+            )
+        except RuntimeError as e:
+            _tesserocr_failed = True
+            logger.warning(f"tesserocr unavailable, falling back to pytesseract: {e}")
+            return None
+        setattr(_tesseract_local, name, api)
+    return api
+
+
+def _get_table_tesseract_api():
+    """Get this thread's tesserocr API for table crops, tuned by _TESSERACT_VARIABLES."""
+    return _get_thread_api('table_api', _TESSERACT_VARIABLES)
+
+
+def _get_page_tesseract_api():
+    """Get this thread's tesserocr API for full-page text, with Tesseract's defaults."""
+    return _get_thread_api('page_api', {})
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Get the shared worker pool of the given size, creating it on first use.
+    
+    Args:
+        max_workers: Number of worker processes
+        
+    Returns:
+        ProcessPoolExecutor using the 'spawn' start method
+    """
+    with _process_pools_lock:
+        pool = _process_pools.get(max_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')
+            )
+            _process_pools[max_workers] = pool
+        return pool
+
+
+@atexit.register
+def _shutdown_process_pools() -> None:
+    """Shut down every shared worker pool, waiting for its workers to exit."""
+    with _process_pools_lock:
+        pools = list(_process_pools.values())
+        _process_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+@contextmanager
+def _as_bmp(image) -> Iterator[Image.Image]:
+    """
+    Mark a rendered image as BMP for the duration of pytesseract's temp-file handoff.
+    
+    pytesseract writes images without a format as PNG, spending a DEFLATE pass
+    on a raster Tesseract decodes straight away; BMP is written uncompressed.
+    A caller's image gets its format back afterwards, so later stages never see
+    the temporary tag.
+    
+    Args:
+        image: PIL Image or pixel array to hand to pytesseract
+        
+    Yields:
+        The image as a PIL Image
+    """
+    if isinstance(image, np.ndarray):
+        image = Image.fromarray(image)
+        image.format = 'BMP'
+        yield image
+    elif isinstance(image, Image.Image) and not image.format:
+        original_format = image.format
+        image.format = 'BMP'
+        try:
+            yield image
+        finally:
+            image.format = original_format
+    else:
+        yield image
+
+
+def _set_api_image(api, image) -> None:
+    """
+    Hand an image's pixels to a tesserocr API without encoding it.
+    
+    Args:
+        api: tesserocr.PyTessBaseAPI instance
+        image: PIL Image, or an 8-bit pixel array of shape (h, w) or (h, w, channels)
+    """
+    if not isinstance(image, np.ndarray):
+        api.SetImage(image)
+        return
+    
+    pixels = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+    bytes_per_pixel = pixels.shape[2] if pixels.ndim == 3 else 1
+    api.SetImageBytes(pixels.tobytes(), width, height, bytes_per_pixel, pixels.strides[0])
+
+
+def _image_to_data(image) -> Dict[str, List]:
+    """
+    Run word-level OCR on an image, reading it as a single block of text.
+    
+    Args:
+        image: PIL Image or pixel array to recognise
+        
+    Returns:
+        Dict of parallel lists keyed 'text', 'left', 'top', 'width', 'height'
+        and 'conf', the same shape as pytesseract's Output.DICT
+    """
+    api = _get_table_tesseract_api()
+    if api is None:
+        with _as_bmp(image) as bmp_image:
+            return pytesseract.image_to_data(
+                bmp_image, config=_TABLE_OCR_CONFIG, output_type=pytesseract.Output.DICT
+            )
+    
+    data = {'text': [], 'left': [], 'top': [], 'width': [], 'height': [], 'conf': []}
+    api.SetPageSegMode(tesserocr.PSM.SINGLE_BLOCK)
+    _set_api_image(api, image)
+    api.Recognize()
+    level = tesserocr.RIL.WORD
+    for word in tesserocr.iterate_level(api.GetIterator(), level):
+        left, top, right, bottom = word.BoundingBox(level)
+        data['text'].append(word.GetUTF8Text(level) or '')
+        data['left'].append(left)
+        data['top'].append(top)
+        data['width'].append(right - left)
+        data['height'].append(bottom - top)
+        data['conf'].append(word.Confidence(level))
+    return data
+
+
+def _image_to_string(image) -> str:
+    """
+    Run full-text OCR on an image.
+    
+    Args:
+        image: PIL Image or pixel array to recognise
+        
+    Returns:
+        Recognised text
+    """
+    api = _get_page_tesseract_api()
+    if api is None:
+        with _as_bmp(image) as bmp_image:
+            return pytesseract.image_to_string(bmp_image, lang="eng", config=_PAGE_OCR_CONFIG)
+    
+    api.SetPageSegMode(tesserocr.PSM.AUTO)
+    _set_api_image(api, image)
+    return api.GetUTF8Text()
+
 
 def extract_tables_with_tesseract_pipeline(pdf_path: str, pages: str = 'all', 
                                           min_confidence: float = 60.0,
-                                          edge_tol: int = 200) -> List[pd.DataFrame]:
+                                          edge_tol: int = 200,
+                                          workers: Optional[int] = None) -> List[pd.DataFrame]:
     """
     Extract tables from scanned PDFs using a comprehensive image-based pipeline.
     
     For each page:
-    1. Convert PDF page to PNG image
-    2. Try camelot.read_pdf on the PNG with lattice flavor
-    3. If no tables found, detect table regions and OCR each crop with pytesseract
-    4. Return same structure as camelot (List of DataFrames)
+    1. Render the PDF page to an in-memory PIL image
+    2. Detect table regions and OCR each crop of the image with Tesseract
+    3. Return same structure as camelot (List of DataFrames)
+    
+    Camelot only reads PDFs, so it is not run on the rendered image; nothing is
+    written to disk between rendering and OCR.
+    
+    Pages are processed in the calling process by default; pass workers to
+    spread a multi-page document over a shared pool, one page per task.
     
     Args:
         pdf_path: Path to the PDF file to process
         pages: Pages to process (e.g., 'all', '1', '1-3', '1,2,3')
         min_confidence: Minimum OCR confidence threshold (0-100)
-        edge_tol: Edge tolerance for camelot lattice detection
+        edge_tol: Edge tolerance for camelot lattice detection (unused on the image path)
+        workers: Worker processes to spread pages over (defaults to processing
+            pages in the calling process; 2 or more uses a shared process pool)
         
     Returns:
         List of pandas DataFrames, one for each detected table
@@ -38,98 +292,264 @@ def extract_tables_with_tesseract_pipeline(pdf_path: str, pages: str = 'all',
         FileNotFoundError: If PDF file doesn't exist
         Exception: If processing fails
     """
+    pdf_file = Path(pdf_path)
+    if not pdf_file.exists():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    
     try:
-        pdf_file = Path(pdf_path)
-        if not pdf_file.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        opened_pdf = pdfplumber.open(pdf_path)
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        raise _pipeline_failure(pdf_path, e)
+    
+    # Errors inside the pipeline are wrapped by the shared-handle variant itself
+    with opened_pdf as pdf:
+        return _extract_tables_with_tesseract_pipeline_from_pdf(
+            pdf, pdf_path, pages, min_confidence, edge_tol, workers
+        )
+
+
+def _pipeline_failure(pdf_path: str, error: Exception) -> Exception:
+    """
+    Log a Tesseract pipeline failure and build the exception callers see.
+    
+    Args:
+        pdf_path: Path of the PDF being processed
+        error: The underlying error
+        
+    Returns:
+        Exception carrying the pipeline's standard failure message
+    """
+    logger.error(f"Tesseract pipeline failed for {pdf_path}: {error}")
+    return Exception(f"Tesseract pipeline failed: {str(error)}")
+
+
+def _extract_tables_with_tesseract_pipeline_from_pdf(pdf, pdf_path: str, pages: str = 'all',
+                                                    min_confidence: float = 60.0,
+                                                    edge_tol: int = 200,
+                                                    workers: Optional[int] = None) -> List[pd.DataFrame]:
+    """
+    Run the Tesseract table pipeline on an already open PDF.
+    
+    Lets callers that also read the document themselves share one pdfplumber
+    handle, and with it the parsed fonts and page objects.
+    
+    Args:
+        pdf: Open pdfplumber PDF
+        pdf_path: Path the PDF was opened from, re-opened by worker processes
+        pages: Pages to process (e.g., 'all', '1', '1-3', '1,2,3')
+        min_confidence: Minimum OCR confidence threshold (0-100)
+        edge_tol: Edge tolerance for camelot lattice detection (unused on the image path)
+        workers: Worker processes to spread pages over (defaults to processing
+            pages in the calling process; 2 or more uses a shared process pool)
+        
+    Returns:
+        List of pandas DataFrames, one for each detected table
         
+    Raises:
+        Exception: If processing fails, with the same message as
+            extract_tables_with_tesseract_pipeline
+    """
+    try:
         logger.info(f"Starting Tesseract pipeline for scanned PDF: {pdf_path}")
         logger.info(f"Pages: {pages}, Min confidence: {min_confidence}, Edge tolerance: {edge_tol}")
         
-        all_dataframes = []
+        # Determine which pages to process
+        if pages == 'all':
+            page_numbers = list(range(len(pdf.pages)))
+        else:
+            page_numbers = _parse_page_specification(pages, len(pdf.pages))
         
-        with pdfplumber.open(pdf_path) as pdf:
-            # Determine which pages to process
-            if pages == 'all':
-                page_numbers = list(range(len(pdf.pages)))
-            else:
-                page_numbers = _parse_page_specification(pages, len(pdf.pages))
-            
-            logger.info(f"Processing {len(page_numbers)} pages")
-            
-            for page_idx in page_numbers:
-                page = pdf.pages[page_idx]
-                page_num = page_idx + 1
-                
-                logger.info(f"Processing page {page_num}")
-                
-                # Convert page to PNG image
-                page_image = _convert_page_to_image(page, resolution=300)
-                
-                # Use table region detection + pytesseract OCR
-                # Note: Camelot cannot process image files, so we skip that step
-                logger.info(f"Using region detection for scanned page {page_num}")
-                tesseract_tables = _extract_tables_with_region_detection(
-                    page, page_image, page_num, min_confidence
-                )
-                
-                if tesseract_tables:
-                    logger.info(f"Region detection found {len(tesseract_tables)} tables on page {page_num}")
-                    all_dataframes.extend(tesseract_tables)
-                else:
-                    logger.info(f"No tables found on page {page_num}")
+        logger.info(f"Processing {len(page_numbers)} pages")
+        
+        max_workers = min(workers or 1, len(page_numbers))
+        if max_workers < 2:
+            page_results = _extract_pages_pipelined(pdf, page_numbers, min_confidence)
+        else:
+            # pdfplumber objects don't pickle, so each worker re-opens the PDF for its page
+            page_results = list(_get_process_pool(max_workers).map(
+                _process_one_page,
+                repeat(pdf_path), page_numbers, repeat(min_confidence)
+            ))
+        
+        all_dataframes = [df for page_tables in page_results for df in page_tables]
         
         logger.info(f"Total tables extracted: {len(all_dataframes)}")
         return all_dataframes
-        
-    except FileNotFoundError:
-        raise
     except Exception as e:
-        logger.error(f"Tesseract pipeline failed for {pdf_path}: {e}")
-        raise Exception(f"Tesseract pipeline failed: {str(e)}")
+        raise _pipeline_failure(pdf_path, e)
+
+
+def _extract_pages_pipelined(pdf, page_numbers: List[int],
+                             min_confidence: float) -> List[List[pd.DataFrame]]:
+    """
+    Extract tables page by page, rendering ahead on a background thread.
+    
+    Rendering (pdfium) and OCR (Tesseract) use separate engines, so the next
+    pages are rasterised while the current one is being recognised. Only
+    _RENDER_AHEAD rendered pages are held at once to bound memory. Everything
+    that parses the page through pdfplumber stays on the calling thread, since
+    pages share one underlying file stream.
+    
+    Args:
+        pdf: Open pdfplumber PDF
+        page_numbers: 0-indexed pages to process, in order
+        min_confidence: Minimum OCR confidence threshold
+        
+    Returns:
+        List of DataFrames for each page, in page order
+    """
+    page_results = []
+    renders = deque()
+    pending = iter(page_numbers)
+    
+    with ThreadPoolExecutor(max_workers=1) as renderer:
+        def render_next():
+            page_idx = next(pending, None)
+            if page_idx is not None:
+                page = pdf.pages[page_idx]
+                resolution = _choose_resolution(page)
+                renders.append((page_idx, resolution,
+                                renderer.submit(_convert_page_to_image, page, resolution)))
+        
+        for _ in range(_RENDER_AHEAD):
+            render_next()
+        
+        while renders:
+            page_idx, resolution, render = renders.popleft()
+            page_image = render.result()
+            render_next()
+            page_results.append(_extract_page_tables(
+                pdf.pages[page_idx], page_idx + 1, min_confidence, page_image, resolution
+            ))
+    
+    return page_results
+
+
+def _process_one_page(pdf_path: str, page_idx: int, min_confidence: float) -> List[pd.DataFrame]:
+    """
+    Extract tables from a single page in a worker process.
+    
+    Args:
+        pdf_path: Path to the PDF file to process
+        page_idx: 0-indexed page number
+        min_confidence: Minimum OCR confidence threshold
+        
+    Returns:
+        List of DataFrames extracted from the page
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return _extract_page_tables(pdf.pages[page_idx], page_idx + 1, min_confidence)
+
+
+def _extract_page_tables(page, page_num: int, min_confidence: float,
+                         page_image: Optional[Image.Image] = None,
+                         resolution: Optional[int] = None) -> List[pd.DataFrame]:
+    """
+    Run the image pipeline on one pdfplumber page.
+    
+    Args:
+        page: pdfplumber page object
+        page_num: 1-indexed page number for logging
+        min_confidence: Minimum OCR confidence threshold
+        page_image: The page already rendered, if the caller rendered it ahead
+        resolution: DPI page_image was rendered at (required with page_image)
+        
+    Returns:
+        List of DataFrames extracted from the page
+    """
+    logger.info(f"Processing page {page_num}")
+    
+    # Render the page in memory; the image goes straight to OCR without an encode
+    if page_image is None:
+        resolution = _choose_resolution(page)
+        page_image = _convert_page_to_image(page, resolution)
+    
+    # Use table region detection + Tesseract OCR
+    # Note: Camelot cannot process image files, so we skip that step
+    logger.info(f"Using region detection for scanned page {page_num}")
+    tesseract_tables = _extract_tables_with_region_detection(
+        page, page_image, page_num, min_confidence, resolution
+    )
+    
+    if tesseract_tables:
+        logger.info(f"Region detection found {len(tesseract_tables)} tables on page {page_num}")
+    else:
+        logger.info(f"No tables found on page {page_num}")
+    return tesseract_tables
 
 
 def _parse_page_specification(pages: str, total_pages: int) -> List[int]:
     """
     Parse page specification string into list of 0-indexed page numbers.
     
+    Ranges are clipped to the document before they are expanded, so a spec
+    like '1-100000' costs no more than the pages that actually exist.
+    
     Args:
         pages: Page specification (e.g., '1', '1-3', '1,2,3')
         total_pages: Total number of pages in PDF
         
     Returns:
-        List of 0-indexed page numbers
+        Sorted list of unique, valid 0-indexed page numbers
     """
-    page_numbers = []
+    parts = []
     
     for part in pages.split(','):
         part = part.strip()
         if '-' in part:
             start, end = part.split('-')
-            start_idx = int(start) - 1  # Convert to 0-indexed
-            end_idx = int(end) - 1
-            page_numbers.extend(range(start_idx, end_idx + 1))
+            start_idx = max(int(start) - 1, 0)  # Convert to 0-indexed
+            end_idx = min(int(end), total_pages)
+            parts.append(np.arange(start_idx, end_idx))
         else:
-            page_numbers.append(int(part) - 1)  # Convert to 0-indexed
+            parts.append(np.array([int(part) - 1]))  # Convert to 0-indexed
+    
+    # Drop duplicates and filter out invalid page numbers
+    page_numbers = np.unique(np.concatenate(parts))
+    valid_pages = page_numbers[(page_numbers >= 0) & (page_numbers < total_pages)]
+    
+    return valid_pages.tolist()
+
+
+def _choose_resolution(page) -> int:
+    """
+    Pick a rendering DPI from the page's median font size.
+    
+    Tesseract's accuracy drops off once text renders smaller than 10pt type at
+    300 DPI, so pages set in larger type are rendered at proportionally lower
+    resolution. Pages without a text layer (scans) use the default.
     
-    # Filter out invalid page numbers
-    valid_pages = [p for p in page_numbers if 0 <= p < total_pages]
+    Args:
+        page: pdfplumber page object
+        
+    Returns:
+        DPI between _MIN_RESOLUTION and _DEFAULT_RESOLUTION
+    """
+    sizes = [char['size'] for char in page.chars]
+    if not sizes:
+        return _DEFAULT_RESOLUTION
     
-    return valid_pages
+    resolution = _DEFAULT_RESOLUTION * _REFERENCE_FONT_SIZE / float(np.median(sizes))
+    return int(np.clip(resolution, _MIN_RESOLUTION, _DEFAULT_RESOLUTION))
 
 
-def _convert_page_to_image(page, resolution: int = 300) -> Image.Image:
+def _convert_page_to_image(page, resolution: Optional[int] = None) -> Image.Image:
     """
     Convert a pdfplumber page to PIL Image.
     
     Args:
         page: pdfplumber page object
-        resolution: DPI for image conversion
+        resolution: DPI for image conversion (chosen from the page's font size if None)
         
     Returns:
         PIL Image object
     """
     try:
+        if resolution is None:
+            resolution = _choose_resolution(page)
+        
         # Use pdfplumber's to_image method
         page_image = page.to_image(resolution=resolution)
         return page_image.original
@@ -138,19 +558,17 @@ def _convert_page_to_image(page, resolution: int = 300) -> Image.Image:
         raise
 
 
-
-
-
 def _extract_tables_with_region_detection(page, page_image: Image.Image, page_num: int, 
-                                         min_confidence: float) -> List[pd.DataFrame]:
+                                         min_confidence: float, resolution: int) -> List[pd.DataFrame]:
     """
-    Extract tables using table region detection and pytesseract OCR.
+    Extract tables using table region detection and Tesseract OCR.
     
     Args:
         page: pdfplumber page object
         page_image: PIL Image of the page
         page_num: Page number for logging
         min_confidence: Minimum OCR confidence threshold
+        resolution: DPI page_image was rendered at
         
     Returns:
         List of DataFrames extracted from table regions
@@ -165,6 +583,13 @@ def _extract_tables_with_region_detection(page, page_image: Image.Image, page_nu
         
         logger.info(f"Found {len(tables)} table regions on page {page_num}")
         
+        # Convert the page to a pixel array once; each table crop is a view of it
+        # and goes to OCR as raw pixels
+        pixels = np.asarray(page_image)
+        
+        # Table boxes are in PDF points (72 per inch); the image is in pixels
+        scale = resolution / 72.0
+        
         dataframes = []
         for table_idx, table in enumerate(tables):
             try:
@@ -172,8 +597,9 @@ def _extract_tables_with_region_detection(page, page_image: Image.Image, page_nu
                 bbox = table.bbox
                 logger.debug(f"Table {table_idx + 1} bbox: {bbox}")
                 
-                # Crop the table region from the image
-                table_image = page_image.crop(bbox)
+                # Crop the table region from the image (scaled to pixels, rounded like PIL's crop)
+                left, top, right, bottom = (int(round(edge * scale)) for edge in bbox)
+                table_image = pixels[max(top, 0):bottom, max(left, 0):right]
                 
                 # Apply OCR to the cropped table
                 table_df = _ocr_table_image(table_image, table_idx + 1, page_num, min_confidence)
@@ -195,13 +621,13 @@ def _extract_tables_with_region_detection(page, page_image: Image.Image, page_nu
         return []
 
 
-def _ocr_table_image(table_image: Image.Image, table_idx: int, page_num: int, 
+def _ocr_table_image(table_image, table_idx: int, page_num: int, 
                     min_confidence: float) -> Optional[pd.DataFrame]:
     """
     Apply OCR to a table image and convert to DataFrame.
     
     Args:
-        table_image: PIL Image of the table region
+        table_image: PIL Image or pixel array of the table region
         table_idx: Table index for logging
         page_num: Page number for logging
         min_confidence: Minimum OCR confidence threshold
@@ -211,32 +637,28 @@ def _ocr_table_image(table_image: Image.Image, table_idx: int, page_num: int,
     """
     try:
         # Get OCR data with bounding boxes and confidence scores
-        ocr_data = pytesseract.image_to_data(table_image, output_type=pytesseract.Output.DICT)
+        ocr_data = _image_to_data(table_image)
         
-        # Filter by confidence
-        confident_data = []
-        for i in range(len(ocr_data['text'])):
-            confidence = int(ocr_data['conf'][i])
-            text = ocr_data['text'][i].strip()
-            
-            if confidence >= min_confidence and text:
-                confident_data.append({
-                    'text': text,
-                    'left': ocr_data['left'][i],
-                    'top': ocr_data['top'][i],
-                    'width': ocr_data['width'][i],
-                    'height': ocr_data['height'][i],
-                    'confidence': confidence
-                })
+        # Filter by confidence with one vectorised mask; most entries Tesseract
+        # returns are empty layout boxes at conf -1, so they never become objects
+        confidences = np.trunc(np.asarray(ocr_data['conf'], dtype=float))
+        indices = np.flatnonzero(confidences >= min_confidence)
+        texts = np.array([ocr_data['text'][i].strip() for i in indices], dtype=object)
+        has_text = texts.astype(bool)
+        indices, texts = indices[has_text], texts[has_text]
         
-        if not confident_data:
+        if not indices.size:
             logger.debug(f"No confident OCR data for table {table_idx} on page {page_num}")
             return None
         
-        logger.debug(f"Found {len(confident_data)} confident OCR elements for table {table_idx}")
+        logger.debug(f"Found {indices.size} confident OCR elements for table {table_idx}")
         
         # Reconstruct table structure from OCR data
-        table_df = _reconstruct_table_from_ocr_data(confident_data)
+        table_df = _reconstruct_table(
+            texts,
+            np.asarray(ocr_data['top'])[indices],
+            np.asarray(ocr_data['left'])[indices],
+        )
         
         return table_df
         
@@ -258,51 +680,61 @@ def _reconstruct_table_from_ocr_data(ocr_data: List[Dict[str, Any]]) -> pd.DataF
     if not ocr_data:
         return pd.DataFrame()
     
-    # Sort by top position to group into rows
-    ocr_data.sort(key=lambda x: x['top'])
+    return _reconstruct_table(
+        np.array([element['text'] for element in ocr_data], dtype=object),
+        np.array([element['top'] for element in ocr_data]),
+        np.array([element['left'] for element in ocr_data]),
+    )
+
+
+def _reconstruct_table(texts: np.ndarray, tops: np.ndarray, lefts: np.ndarray) -> pd.DataFrame:
+    """
+    Reconstruct a table from parallel arrays of word texts and positions.
+    
+    Words are grouped into rows by vertical position (a row holds every word
+    within the row tolerance of its topmost word), then ordered left to right
+    within each row. The grouping runs on NumPy arrays, so the per-word work
+    happens in C rather than in the interpreter.
     
-    # Group elements into rows based on vertical position
-    rows = []
-    current_row = []
-    current_row_top = None
+    Args:
+        texts: Object array of word texts
+        tops: Top edge of each word's bounding box
+        lefts: Left edge of each word's bounding box
+        
+    Returns:
+        DataFrame representing the reconstructed table
+    """
     row_tolerance = 10  # pixels
     
-    for element in ocr_data:
-        if current_row_top is None or abs(element['top'] - current_row_top) <= row_tolerance:
-            current_row.append(element)
-            current_row_top = element['top'] if current_row_top is None else current_row_top
-        else:
-            # Start new row
-            if current_row:
-                # Sort current row by left position
-                current_row.sort(key=lambda x: x['left'])
-                rows.append(current_row)
-            current_row = [element]
-            current_row_top = element['top']
-    
-    # Add the last row
-    if current_row:
-        current_row.sort(key=lambda x: x['left'])
-        rows.append(current_row)
-    
-    # Convert to DataFrame
-    if not rows:
-        return pd.DataFrame()
+    # Sort by top position to group into rows
+    order = np.argsort(tops, kind='stable')
+    sorted_tops = tops[order]
+    
+    # Each row starts at the first word beyond the tolerance of the previous row's start
+    row_starts = [0]
+    while True:
+        next_start = int(np.searchsorted(sorted_tops, sorted_tops[row_starts[-1]] + row_tolerance, side='right'))
+        if next_start >= len(sorted_tops):
+            break
+        row_starts.append(next_start)
+    row_starts = np.asarray(row_starts)
+    row_ids = np.zeros(len(order), dtype=np.intp)
+    row_ids[row_starts[1:]] = 1
+    row_ids = np.cumsum(row_ids)
     
-    # Find maximum number of columns
-    max_cols = max(len(row) for row in rows)
+    # Order each row by left position, keeping rows contiguous
+    within_rows = np.lexsort((lefts[order], row_ids))
+    order = order[within_rows]
+    col_ids = np.arange(len(order)) - row_starts[row_ids]
     
-    # Create 2D array
-    table_data = []
-    for row in rows:
-        row_data = [elem['text'] for elem in row]
-        # Pad with empty strings if needed
-        while len(row_data) < max_cols:
-            row_data.append('')
-        table_data.append(row_data)
+    # Create 2D array, padding short rows with empty strings
+    max_cols = int(np.diff(np.append(row_starts, len(order))).max())
+    table_data = np.full((len(row_starts), max_cols), '', dtype=object)
+    table_data[row_ids, col_ids] = texts[order]
     
-    # Create DataFrame
-    df = pd.DataFrame(table_data)
+    # Create DataFrame column by column so each column is one contiguous block,
+    # rather than strided slices of the row-major grid
+    df = pd.DataFrame({col: table_data[:, col] for col in range(max_cols)}, dtype=_CELL_DTYPE)
     
     # Clean up the DataFrame
     df = df.replace('', pd.NA).dropna(how='all').dropna(axis=1, how='all')
@@ -324,16 +756,18 @@ def extract_tables_and_text(pdf_path: str) -> List[Dict]:
     try:
         logger.info(f"Starting legacy extract_tables_and_text for: {pdf_path}")
         
-        # Use the new pipeline to extract tables
-        table_dataframes = extract_tables_with_tesseract_pipeline(pdf_path)
-        
-        # Also extract full text for each page
+        # One open document serves both the table pipeline and the full-text pass
         results = []
         with pdfplumber.open(pdf_path) as pdf:
+            # Use the new pipeline to extract tables, in-process so pages render
+            # from this handle instead of being re-opened by worker processes
+            table_dataframes = _extract_tables_with_tesseract_pipeline_from_pdf(pdf, pdf_path, workers=1)
+            
+            # Also extract full text for each page
             for page_num, page in enumerate(pdf.pages, start=1):
                 # Convert page to image and extract full text
                 page_image = _convert_page_to_image(page)
-                full_text = pytesseract.image_to_string(page_image, lang="eng")
+                full_text = _image_to_string(page_image)
                 
                 # Find tables for this page (simplified approach)
                 page_tables = []
@@ -396,6 +830,9 @@ def get_tesseract_table_metadata(pdf_path: str, pages: str = 'all') -> List[Dict
     """
     Get metadata about tables detected by the Tesseract pipeline.
     
+    Results are cached per file version (path, pages, modification time and
+    size), so repeated polls for an unchanged PDF don't re-run OCR.
+    
     Args:
         pdf_path: Path to the PDF file to process
         pages: Pages to process
@@ -406,21 +843,39 @@ def get_tesseract_table_metadata(pdf_path: str, pages: str = 'all') -> List[Dict
     try:
         logger.info(f"Getting Tesseract table metadata for: {pdf_path}")
         
-        table_dataframes = extract_tables_with_tesseract_pipeline(pdf_path, pages)
-        
-        metadata = []
-        for i, df in enumerate(table_dataframes):
-            table_info = {
-                'table_index': i + 1,
-                'rows': df.shape[0],
-                'columns': df.shape[1],
-                'is_empty': df.empty,
-                'source': 'tesseract_pipeline',
-                'extraction_method': 'camelot_on_image' if not df.empty else 'region_detection'
-            }
-            metadata.append(table_info)
-        
-        return metadata
+        stat = Path(pdf_path).stat()
+        cache_key = (str(Path(pdf_path).resolve()), pages, stat.st_mtime_ns, stat.st_size)
+        
+        with _table_metadata_lock:
+            metadata = _table_metadata_cache.get(cache_key)
+            if metadata is not None:
+                _table_metadata_cache.move_to_end(cache_key)
+        
+        if metadata is None:
+            table_dataframes = extract_tables_with_tesseract_pipeline(pdf_path, pages)
+            
+            metadata = []
+            for i, df in enumerate(table_dataframes):
+                table_info = {
+                    'table_index': i + 1,
+                    'rows': df.shape[0],
+                    'columns': df.shape[1],
+                    'is_empty': df.empty,
+                    'source': 'tesseract_pipeline',
+                    'extraction_method': 'camelot_on_image' if not df.empty else 'region_detection'
+                }
+                metadata.append(table_info)
+            
+            with _table_metadata_lock:
+                _table_metadata_cache[cache_key] = metadata
+                _table_metadata_cache.move_to_end(cache_key)
+                if len(_table_metadata_cache) > _METADATA_CACHE_SIZE:
+                    _table_metadata_cache.popitem(last=False)
+        else:
+            logger.info(f"Using cached table metadata for: {pdf_path}")
+        
+        # Hand out copies so callers can't alter the cached entries
+        return [dict(table_info) for table_info in metadata]
         
     except Exception as e:
         logger.error(f"Failed to get Tesseract table metadata: {e}")
@@ -0,0 +1,55 @@
+"""Sample statement constants shared by conftest.py and the test modules."""
+from pathlib import Path
+
+SAMPLE_DATA_DIR = Path(__file__).parent / "sample_data"
+
+# SHA-256 of the sample statements the OCR expectations were written against
+SAMPLE_PDF_SHA256 = {
+    "bank-statement-1.pdf": "a85eec86fe966b0e63d0de592a2a66649265824e93052e534fedfad0a4670c2d",
+    "bank-statement-2.pdf": "a17b26f9924c40e1910cb503e39c2f888ff00eb860844668bdbe991693c0c831",
+    "bank-statement-3.pdf": "4c26137c31fad4b6dd756c130a7f4e2589a1d08016f0f6e6eef9e700c8ba4679",
+    "bank-statement-4.pdf": "1a54a2d713cc1ea594f863f2e7bfe93469c7592cf94471dc2955e089e66c0232",
+}
+
+# Checked once at import so sample-driven tests skip before any fixture runs
+HAS_SAMPLES = all((SAMPLE_DATA_DIR / name).exists() for name in SAMPLE_PDF_SHA256)
+
+# Minimal valid single-page PDF, built once and shared by the upload tests
+DUMMY_PDF_BYTES = b"""%PDF-1.4
+1 0 obj
+<<
+/Type /Catalog
+/Pages 2 0 R
+>>
+endobj
+
+2 0 obj
+<<
+/Type /Pages
+/Kids [3 0 R]
+/Count 1
+>>
+endobj
+
+3 0 obj
+<<
+/Type /Page
+/Parent 2 0 R
+/MediaBox [0 0 612 792]
+>>
+endobj
+
+xref
+0 4
+0000000000 65535 f 
+0000000009 00000 n 
+0000000074 00000 n 
+0000000120 00000 n 
+trailer
+<<
+/Size 4
+/Root 1 0 R
+>>
+startxref
+179
+%%EOF"""
@@ -0,0 +1,24 @@
+"""Shared pytest configuration for the backend test suite."""
+import hashlib
+
+import pytest
+
+from _samples import SAMPLE_DATA_DIR
+
+
+@pytest.fixture(scope="session")
+def sample_pdfs():
+    """Read every sample bank statement once per session, keyed by file name."""
+    return {
+        path.name: path.read_bytes()
+        for path in sorted(SAMPLE_DATA_DIR.glob("bank-statement-*.pdf"))
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_digests(sample_pdfs):
+    """SHA-256 of each loaded sample statement, computed once per session."""
+    return {
+        name: hashlib.sha256(content, usedforsecurity=False).hexdigest()
+        for name, content in sample_pdfs.items()
+    }
@@ -2,11 +2,6 @@ import pytest
 import pandas as pd
 from pathlib import Path
 from unittest.mock import Mock, patch
-import sys
-import os
-
-# Add the app directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app.services.camelot_ocr import (
     extract_tables_with_camelot,
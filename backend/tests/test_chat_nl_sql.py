@@ -1,18 +1,11 @@
 import pytest
 import pytest_asyncio
-import os
-import sys
 import json
 import re
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
-from pathlib import Path
 from fastapi.testclient import TestClient
 from fastapi import status
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 from app.main import app
 from app.routers.chat import ChatRequest, ChatResponse, handle_special_queries
 
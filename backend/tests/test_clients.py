@@ -1,19 +1,12 @@
 import pytest
 import pytest_asyncio
-import os
-import sys
 from datetime import datetime
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from pathlib import Path
 from fastapi.testclient import TestClient
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import ValidationError
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 from app.main import app
 from app.models import Client
 from app.schemas.client import ClientRead, ClientCreate, ClientUpdate, ClientBase
@@ -1,7 +1,6 @@
 import pytest
 import pytest_asyncio
 import os
-import sys
 import asyncio
 from pathlib import Path
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -9,14 +8,9 @@ from sqlalchemy import text
 from alembic.config import Config
 from alembic import command
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 # Import models to ensure they're registered with Base
 from app.models import Client, Statement, Transaction, Base
 
-
 def get_alembic_config():
     """Get Alembic configuration for testing"""
     from pathlib import Path
@@ -41,7 +35,8 @@ async def async_engine():
     test_db_url = os.getenv("TEST_DATABASE_URL", default_test_db_url)
     os.environ["DATABASE_URL"] = test_db_url
     
-    engine = create_async_engine(test_db_url, echo=True)
+    # Statement logging is opt-in; set SQL_ECHO=1 when debugging
+    engine = create_async_engine(test_db_url, echo=os.getenv("SQL_ECHO", "").lower() in ("1", "true", "yes"))
     
     # Create all tables using SQLAlchemy metadata (simpler for testing)
     async with engine.begin() as conn:
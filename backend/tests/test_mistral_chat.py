@@ -1,16 +1,9 @@
 import pytest
 import pytest_asyncio
-import os
-import sys
 import json
 from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
 import requests
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 from app.services.mistral_chat import query_mistral
 
 
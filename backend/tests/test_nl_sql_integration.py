@@ -1,17 +1,10 @@
 import pytest
 import pytest_asyncio
-import os
-import sys
 import json
 from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
 from fastapi.testclient import TestClient
 from fastapi import status
 
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 from app.main import app
 from app.llms.mistral_llm import MistralLLM
 from app.routers.chat import create_enhanced_prompt, handle_special_queries
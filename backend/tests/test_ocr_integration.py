@@ -1,42 +1,82 @@
 import pytest
 import os
-import asyncio
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import importlib
+from unittest.mock import patch, Mock, MagicMock
+from pdfplumber.page import Page
+from pdfplumber.pdf import PDF
+
+SAMPLE_PDF_1 = os.path.join(os.path.dirname(__file__), 'sample_data', 'bank-statement-1.pdf')
+
+
+@pytest.fixture(scope="session")
+def ocr():
+    """Import the OCR service lazily so collection doesn't pay for the OCR stack."""
+    return importlib.import_module("app.services.ocr")
+
+
+@pytest.fixture(scope="session")
+def pd():
+    """Import pandas once per session."""
+    return pytest.importorskip("pandas")
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from app.services.ocr import run_ocr, run_structure_analysis, run_unified_ocr_pipeline
-from app.services.pdf_utils import is_text_page, is_scanned_page
+@pytest.fixture(scope="session")
+def sample_pdf_bytes():
+    """Read the sample PDF into memory once per session."""
+    if not os.path.exists(SAMPLE_PDF_1):
+        pytest.skip("Sample PDF not found: bank-statement-1.pdf")
+    with open(SAMPLE_PDF_1, 'rb') as f:
+        return f.read()
 
 
+@pytest.fixture(scope="session")
+def sample_pdf_path(tmp_path_factory, sample_pdf_bytes):
+    """Materialise the in-memory sample PDF once for APIs that need a path."""
+    path = tmp_path_factory.mktemp("ocr_integration") / "bank-statement-1.pdf"
+    path.write_bytes(sample_pdf_bytes)
+    return str(path)
+
+
+_EXPECTED_KEYS = frozenset({"page", "tables", "full_text", "page_type", "extraction_method"})
+
+
+def _assert_page_result(page_result, *, page=1, extraction_method, page_type_contains=None):
+    """Check the shape of a single unified pipeline page result."""
+    assert _EXPECTED_KEYS <= page_result.keys()
+    assert page_result['page'] == page
+    
+    # Tables are list of lists
+    assert isinstance(page_result['tables'], list)
+    for table in page_result['tables']:
+        assert isinstance(table, list)
+        if table:
+            assert isinstance(table[0], list)
+    
+    assert isinstance(page_result['full_text'], str)
+    if page_type_contains is not None:
+        assert page_type_contains in page_result['page_type']
+    assert page_result['extraction_method'] == extraction_method
+
+
+@pytest.mark.usefixtures("mock_full_text_extraction")
 class TestOCRIntegration:
     """Integration tests for the unified OCR pipeline."""
     
     @pytest.fixture
-    def sample_pdf_path(self):
-        """Return path to a sample PDF for testing."""
-        return os.path.join(os.path.dirname(__file__), 'sample_data', 'bank-statement-1.pdf')
-    
-    @pytest.fixture
-    def mock_text_page(self):
+    def mock_text_page(self, ocr):
         """Mock is_text_page to return True (vector PDF)."""
         with patch('app.services.ocr.is_text_page', return_value=True):
             yield
     
     @pytest.fixture
-    def mock_scanned_page(self):
+    def mock_scanned_page(self, ocr):
         """Mock is_text_page to return False (scanned PDF)."""
         with patch('app.services.ocr.is_text_page', return_value=False):
             yield
     
     @pytest.fixture
-    def mock_camelot_extraction(self):
+    def mock_camelot_extraction(self, ocr, pd):
         """Mock Camelot extraction to return sample DataFrames."""
-        import pandas as pd
-        
         # Create mock DataFrames
         mock_df1 = pd.DataFrame([
             ['Date', 'Description', 'Amount'],
@@ -53,10 +93,8 @@ class TestOCRIntegration:
             yield
     
     @pytest.fixture
-    def mock_tesseract_extraction(self):
+    def mock_tesseract_extraction(self, ocr, pd):
         """Mock Tesseract extraction to return sample DataFrames."""
-        import pandas as pd
-        
         # Create mock DataFrames
         mock_df1 = pd.DataFrame([
             ['Date', 'Payee', 'Amount'],
@@ -67,18 +105,18 @@ class TestOCRIntegration:
         with patch('app.services.ocr.extract_tables_with_tesseract_pipeline', return_value=[mock_df1]):
             yield
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_full_text_extraction(self):
-        """Mock full text extraction."""
+        """Mock full text extraction for every test in the class."""
         def mock_extract_text_side_effect(*args, **kwargs):
             return "Sample extracted text from PDF page"
         
         with patch('pdfplumber.open') as mock_open:
-            mock_page = MagicMock()
+            mock_page = Mock(spec=Page)
             mock_page.extract_text.return_value = "Sample extracted text from PDF page"
             mock_page.to_image.return_value.original = MagicMock()
             
-            mock_pdf = MagicMock()
+            mock_pdf = MagicMock(spec=PDF)
             mock_pdf.pages = [mock_page]
             mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
             mock_pdf.__exit__ = MagicMock(return_value=None)
@@ -86,102 +124,49 @@ class TestOCRIntegration:
             mock_open.return_value = mock_pdf
             yield
     
-    def test_run_unified_ocr_pipeline_camelot_path(self, sample_pdf_path, mock_text_page, 
-                                                   mock_camelot_extraction, mock_full_text_extraction):
+    def test_run_unified_ocr_pipeline_camelot_path(self, ocr, sample_pdf_path, mock_text_page, 
+                                                   mock_camelot_extraction):
         """Test unified OCR pipeline with Camelot (text PDF) path."""
-        results = run_unified_ocr_pipeline(sample_pdf_path)
+        results = ocr.run_unified_ocr_pipeline(sample_pdf_path)
         
         # Verify structure
         assert isinstance(results, list)
         assert len(results) > 0
         
-        # Check first page result
-        page_result = results[0]
-        assert 'page' in page_result
-        assert 'tables' in page_result
-        assert 'full_text' in page_result
-        assert 'page_type' in page_result
-        assert 'extraction_method' in page_result
-        
-        # Verify page number
-        assert page_result['page'] == 1
-        
-        # Verify tables are list of lists
-        assert isinstance(page_result['tables'], list)
-        if page_result['tables']:
-            for table in page_result['tables']:
-                assert isinstance(table, list)
-                if table:
-                    assert isinstance(table[0], list)
-        
-        # Verify full text
-        assert isinstance(page_result['full_text'], str)
-        
-        # Verify page type indicates text page
-        assert 'text' in page_result['page_type']
-        
-        # Verify extraction method is camelot
-        assert page_result['extraction_method'] == 'camelot'
+        _assert_page_result(results[0], extraction_method='camelot', page_type_contains='text')
     
-    def test_run_unified_ocr_pipeline_tesseract_path(self, sample_pdf_path, mock_scanned_page, 
-                                                     mock_tesseract_extraction, mock_full_text_extraction):
+    def test_run_unified_ocr_pipeline_tesseract_path(self, ocr, sample_pdf_path, mock_scanned_page, 
+                                                     mock_tesseract_extraction):
         """Test unified OCR pipeline with Tesseract (scanned PDF) path."""
         with patch('pytesseract.image_to_string', return_value="OCR extracted text"):
-            results = run_unified_ocr_pipeline(sample_pdf_path)
+            results = ocr.run_unified_ocr_pipeline(sample_pdf_path)
         
         # Verify structure
         assert isinstance(results, list)
         assert len(results) > 0
         
-        # Check first page result
-        page_result = results[0]
-        assert 'page' in page_result
-        assert 'tables' in page_result
-        assert 'full_text' in page_result
-        assert 'page_type' in page_result
-        assert 'extraction_method' in page_result
-        
-        # Verify page number
-        assert page_result['page'] == 1
-        
-        # Verify tables are list of lists
-        assert isinstance(page_result['tables'], list)
-        if page_result['tables']:
-            for table in page_result['tables']:
-                assert isinstance(table, list)
-                if table:
-                    assert isinstance(table[0], list)
-        
-        # Verify full text
-        assert isinstance(page_result['full_text'], str)
-        
-        # Verify page type indicates scanned page
-        assert 'scanned' in page_result['page_type']
-        
-        # Verify extraction method is tesseract
-        assert page_result['extraction_method'] == 'tesseract'
+        _assert_page_result(results[0], extraction_method='tesseract', page_type_contains='scanned')
     
-    def test_run_unified_ocr_pipeline_fallback(self, sample_pdf_path, mock_text_page, 
-                                               mock_tesseract_extraction, mock_full_text_extraction):
+    def test_run_unified_ocr_pipeline_fallback(self, ocr, sample_pdf_path, mock_text_page, 
+                                               mock_tesseract_extraction):
         """Test unified OCR pipeline fallback from Camelot to Tesseract."""
         # Mock camelot to fail, then tesseract to succeed
         with patch('app.services.ocr.extract_tables_with_camelot', side_effect=Exception("Camelot failed")):
             with patch('pytesseract.image_to_string', return_value="OCR extracted text"):
-                results = run_unified_ocr_pipeline(sample_pdf_path)
+                results = ocr.run_unified_ocr_pipeline(sample_pdf_path)
         
         # Should get results despite camelot failure
         assert isinstance(results, list)
         assert len(results) > 0
         
-        page_result = results[0]
         # Should fall back to tesseract_fallback
-        assert page_result['extraction_method'] == 'tesseract_fallback'
+        _assert_page_result(results[0], extraction_method='tesseract_fallback')
     
     @pytest.mark.asyncio
-    async def test_run_ocr_preserves_api(self, sample_pdf_path, mock_text_page, 
-                                         mock_camelot_extraction, mock_full_text_extraction):
+    async def test_run_ocr_preserves_api(self, ocr, sample_pdf_path, mock_text_page, 
+                                         mock_camelot_extraction):
         """Test that run_ocr preserves the existing API signature."""
-        result = await run_ocr(sample_pdf_path)
+        result = await ocr.run_ocr(sample_pdf_path)
         
         # Should return list of strings (one per page)
         assert isinstance(result, list)
@@ -192,10 +177,10 @@ class TestOCRIntegration:
             assert isinstance(page_text, str)
     
     @pytest.mark.asyncio
-    async def test_run_structure_analysis_preserves_api(self, sample_pdf_path, mock_text_page, 
-                                                         mock_camelot_extraction, mock_full_text_extraction):
+    async def test_run_structure_analysis_preserves_api(self, ocr, sample_pdf_path, mock_text_page, 
+                                                         mock_camelot_extraction):
         """Test that run_structure_analysis preserves the existing API signature."""
-        result = await run_structure_analysis(sample_pdf_path)
+        result = await ocr.run_structure_analysis(sample_pdf_path)
         
         # Should return list of dicts with structure info
         assert isinstance(result, list)
@@ -207,8 +192,8 @@ class TestOCRIntegration:
             assert 'page' in page_result
             assert 'structure' in page_result
     
-    def test_run_unified_ocr_pipeline_mixed_pages(self, sample_pdf_path, mock_camelot_extraction, 
-                                                  mock_tesseract_extraction, mock_full_text_extraction):
+    def test_run_unified_ocr_pipeline_mixed_pages(self, ocr, sample_pdf_path, mock_camelot_extraction, 
+                                                  mock_tesseract_extraction):
         """Test unified OCR pipeline with mixed page types."""
         
         # Mock different page types: first is text, second is scanned
@@ -218,55 +203,39 @@ class TestOCRIntegration:
             with patch('pytesseract.image_to_string', return_value="OCR extracted text"):
                 # Mock PDF with 2 pages
                 with patch('pdfplumber.open') as mock_open:
-                    mock_page1 = MagicMock()
+                    mock_page1 = Mock(spec=Page)
                     mock_page1.extract_text.return_value = "Text page content"
                     mock_page1.to_image.return_value.original = MagicMock()
                     
-                    mock_page2 = MagicMock()
+                    mock_page2 = Mock(spec=Page)
                     mock_page2.extract_text.return_value = "Scanned page content"
                     mock_page2.to_image.return_value.original = MagicMock()
                     
-                    mock_pdf = MagicMock()
+                    mock_pdf = MagicMock(spec=PDF)
                     mock_pdf.pages = [mock_page1, mock_page2]
                     mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
                     mock_pdf.__exit__ = MagicMock(return_value=None)
                     
                     mock_open.return_value = mock_pdf
                     
-                    results = run_unified_ocr_pipeline(sample_pdf_path)
+                    results = ocr.run_unified_ocr_pipeline(sample_pdf_path)
         
         # Should have 2 pages processed
         assert len(results) == 2
         
         # First page should use camelot
-        page1 = results[0]
-        assert page1['page'] == 1
-        assert page1['extraction_method'] == 'camelot'
-        assert 'text' in page1['page_type']
+        _assert_page_result(results[0], page=1, extraction_method='camelot', page_type_contains='text')
         
         # Second page should use tesseract
-        page2 = results[1]
-        assert page2['page'] == 2
-        assert page2['extraction_method'] == 'tesseract'
-        assert 'scanned' in page2['page_type']
-    
-    def test_run_unified_ocr_pipeline_error_handling(self, sample_pdf_path):
-        """Test error handling in unified OCR pipeline."""
-        # Test with non-existent file
-        with pytest.raises(Exception) as exc_info:
-            run_unified_ocr_pipeline("nonexistent.pdf")
-        assert "failed" in str(exc_info.value).lower()
+        _assert_page_result(results[1], page=2, extraction_method='tesseract', page_type_contains='scanned')
     
-    def test_run_unified_ocr_pipeline_empty_tables(self, sample_pdf_path, mock_text_page, 
-                                                   mock_full_text_extraction):
+    def test_run_unified_ocr_pipeline_empty_tables(self, ocr, pd, sample_pdf_path, mock_text_page):
         """Test unified OCR pipeline with empty table extraction."""
-        import pandas as pd
-        
         # Mock empty dataframe
         empty_df = pd.DataFrame()
         
         with patch('app.services.ocr.extract_tables_with_camelot', return_value=[empty_df]):
-            results = run_unified_ocr_pipeline(sample_pdf_path)
+            results = ocr.run_unified_ocr_pipeline(sample_pdf_path)
         
         # Should still return valid results
         assert len(results) > 0
@@ -276,11 +245,8 @@ class TestOCRIntegration:
         assert isinstance(page_result['tables'], list)
         assert len(page_result['tables']) == 0
     
-    def test_run_unified_ocr_pipeline_table_conversion(self, sample_pdf_path, mock_text_page, 
-                                                       mock_full_text_extraction):
+    def test_run_unified_ocr_pipeline_table_conversion(self, ocr, pd, sample_pdf_path, mock_text_page):
         """Test that DataFrames are properly converted to lists of lists."""
-        import pandas as pd
-        
         # Mock dataframe with specific data
         mock_df = pd.DataFrame([
             ['Col1', 'Col2', 'Col3'],
@@ -289,7 +255,7 @@ class TestOCRIntegration:
         ])
         
         with patch('app.services.ocr.extract_tables_with_camelot', return_value=[mock_df]):
-            results = run_unified_ocr_pipeline(sample_pdf_path)
+            results = ocr.run_unified_ocr_pipeline(sample_pdf_path)
         
         page_result = results[0]
         tables = page_result['tables']
@@ -313,5 +279,15 @@ class TestOCRIntegration:
         assert table[2] == ['A2', 'B2', 'C2']
 
 
+
+def test_run_unified_ocr_pipeline_error_handling(ocr, tmp_path):
+    """Test error handling in unified OCR pipeline (runs against the real pdfplumber)."""
+    # Absolute path that is guaranteed not to exist, independent of the cwd
+    missing_pdf = tmp_path / "nonexistent.pdf"
+    with pytest.raises(Exception) as exc_info:
+        ocr.run_unified_ocr_pipeline(str(missing_pdf))
+    assert "failed" in str(exc_info.value).lower()
+
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -1,11 +1,4 @@
 import pytest
-import os
-import sys
-from pathlib import Path
-
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.routers.chat import handle_special_queries
 
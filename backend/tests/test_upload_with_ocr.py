@@ -1,35 +1,62 @@
 import pytest
 import pytest_asyncio
 import os
-import tempfile
-import sys
-from pathlib import Path
+import httpx
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.pool import StaticPool
 import io
-
-# Add the project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import shutil
+from pathlib import Path
 
 from app.main import app
 from app.db import get_db, Base
 from app.models import Statement, Client
+from _samples import DUMMY_PDF_BYTES, HAS_SAMPLES, SAMPLE_PDF_SHA256
 
 # Test database configuration
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Shared-cache in-memory database: the schema and page cache live as long as the
+# engine's single pooled connection, so they survive across tests. Each xdist
+# worker gets its own database name.
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_URL = f"sqlite+aiosqlite:///file:testdb_{_WORKER_ID}?mode=memory&cache=shared&uri=true"
+
+# Create test engine
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=os.getenv("SQL_ECHO", "").lower() in ("1", "true", "yes"),  # Off unless SQL_ECHO=1, for cleaner test output
+    connect_args={"uri": True},
+    poolclass=StaticPool,  # One connection backs every session
+)
+
 
-# Create test engine and session
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)  # Disable echo for cleaner test output
-TestAsyncSessionLocal = sessionmaker(
-    test_engine, class_=AsyncSession, expire_on_commit=False
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
 )
 
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record):
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN itself
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
 async def override_get_db():
     """Override database dependency for tests"""
-    async with TestAsyncSessionLocal() as session:
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
         try:
             yield session
         finally:
@@ -41,88 +68,119 @@ app.dependency_overrides[get_db] = override_get_db
 # Create test client
 client = TestClient(app)
 
-@pytest_asyncio.fixture(scope="function")
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """HTTP client that drives the app on the test event loop"""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
 async def setup_database():
-    """Setup test database with a test client"""
-    async with test_engine.begin() as conn:
+    """Create the schema and the test client once for the whole session"""
+    # DDL for setup and teardown runs on one connection held for the session
+    async with test_engine.connect() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
-    # Create a test client
-    async with TestAsyncSessionLocal() as session:
-        test_client = Client(
-            name="Test Client",
-            contact_name="Test Contact",
-            contact_email="test@example.com"
-        )
-        session.add(test_client)
-        await session.commit()
-    
-    yield
-    
-    # Cleanup
-    async with test_engine.begin() as conn:
+        
+        # Create a test client in the same transaction as the schema
+        async with AsyncSession(bind=conn) as session:
+            test_client = Client(
+                name="Test Client",
+                contact_name="Test Contact",
+                contact_email="test@example.com"
+            )
+            session.add(test_client)
+            await session.flush()
+        await conn.commit()
+        
+        yield
+        
+        # Cleanup
         await conn.run_sync(Base.metadata.drop_all)
+        await conn.commit()
+    await test_engine.dispose()
 
-def create_minimal_pdf():
-    """Create a minimal valid PDF for basic testing"""
-    pdf_content = b"""%PDF-1.4
-1 0 obj
-<<
-/Type /Catalog
-/Pages 2 0 R
->>
-endobj
-
-2 0 obj
-<<
-/Type /Pages
-/Kids [3 0 R]
-/Count 1
->>
-endobj
-
-3 0 obj
-<<
-/Type /Page
-/Parent 2 0 R
-/MediaBox [0 0 612 792]
->>
-endobj
-
-xref
-0 4
-0000000000 65535 f 
-0000000009 00000 n 
-0000000074 00000 n 
-0000000120 00000 n 
-trailer
-<<
-/Size 4
-/Root 1 0 R
->>
-startxref
-179
-%%EOF"""
-    return pdf_content
+@pytest.fixture(scope="session", autouse=True)
+def upload_dir(tmp_path_factory):
+    """Point the endpoint at a throwaway uploads directory for the session"""
+    path = tmp_path_factory.mktemp("uploads")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("UPLOAD_DIR", str(path))
+        yield path
+
+@pytest.fixture(scope="session")
+def large_pdf_path(tmp_path_factory):
+    """An 11MB sparse file, written once per session without copying any bytes"""
+    path = tmp_path_factory.mktemp("large") / "large_file.pdf"
+    with open(path, "wb") as f:
+        f.truncate(11 * 1024 * 1024)
+    return path
+
+@pytest_asyncio.fixture
+async def db_session(setup_database):
+    """Session for one test, inside a transaction that is rolled back afterwards.
+    
+    The endpoint commits, so the session works in a SAVEPOINT that is reopened
+    after every commit; only the outer transaction is ever rolled back.
+    """
+    async with test_engine.connect() as conn:
+        outer = await conn.begin()
+        nested = await conn.begin_nested()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+        
+        @event.listens_for(session.sync_session, "after_transaction_end")
+        def _restart_savepoint(sync_session, transaction):
+            nonlocal nested
+            if not nested.is_active:
+                nested = conn.sync_connection.begin_nested()
+        
+        async def override_get_test_db():
+            yield session
+        
+        app.dependency_overrides[get_db] = override_get_test_db
+        try:
+            yield session
+        finally:
+            app.dependency_overrides[get_db] = override_get_db
+            await session.close()
+            await outer.rollback()
+
+
+async def remove_uploaded_files(session, statement_ids):
+    """Delete the stored uploads for the given statements with a single query"""
+    result = await session.execute(
+        select(Statement.file_path).where(Statement.id.in_(statement_ids))
+    )
+    for file_path in result.scalars().all():
+        Path(file_path).unlink(missing_ok=True)
 
 
 class TestUploadWithOCR:
     """Comprehensive tests for the upload endpoint with OCR processing"""
 
     @pytest.mark.asyncio
-    async def test_upload_bank_statement_1_success(self, setup_database):
-        """Test upload with bank-statement-1.pdf (the problematic one we fixed)"""
-        pdf_path = "tests/sample_data/bank-statement-1.pdf"
+    @pytest.mark.skipif(not HAS_SAMPLES, reason="sample PDFs missing")
+    @pytest.mark.parametrize("pdf_name,expected_pages,needles,min_text_length", [
+        pytest.param("bank-statement-1.pdf", 2, ("SAMPLE", "JAMES"), 100, id="statement_1"),
+        pytest.param("bank-statement-2.pdf", 1, ("Bank", "Account"), 0, id="statement_2"),
+    ])
+    async def test_upload_bank_statement_success(
+        self, db_session, async_client, sample_pdfs, sample_pdf_digests,
+        pdf_name, expected_pages, needles, min_text_length
+    ):
+        """Test upload and OCR of a known sample statement"""
+        if sample_pdf_digests[pdf_name] != SAMPLE_PDF_SHA256[pdf_name]:
+            pytest.skip(f"Sample PDF changed since its expectations were written: {pdf_name}")
         
-        if not os.path.exists(pdf_path):
-            pytest.skip(f"Sample PDF not found: {pdf_path}")
+        files = {
+            "file": (pdf_name, io.BytesIO(sample_pdfs[pdf_name]), "application/pdf")
+        }
         
-        with open(pdf_path, "rb") as f:
-            files = {
-                "file": ("bank-statement-1.pdf", f, "application/pdf")
-            }
-            
-            response = client.post("/upload/statement?client_id=1", files=files)
+        # This should not crash or timeout
+        response = await async_client.post("/upload/statement?client_id=1", files=files, timeout=120)
         
         assert response.status_code == 201
         data = response.json()
@@ -134,114 +192,61 @@ class TestUploadWithOCR:
         assert isinstance(data["statement_id"], int)
         assert data["statement_id"] > 0
         
-        # Verify OCR worked (bank-statement-1.pdf has 2 pages)
-        assert data["pages_processed"] == 2
-        assert len(data["ocr_preview"]) > 0
-        assert "SAMPLE" in data["ocr_preview"] or "JAMES" in data["ocr_preview"]
-        
-        # Verify database record
-        async with TestAsyncSessionLocal() as session:
-            stmt = await session.execute(select(Statement).where(Statement.id == data["statement_id"]))
-            statement = stmt.scalar_one_or_none()
-            assert statement is not None
-            assert statement.client_id == 1
-            assert statement.ocr_text is not None
-            assert len(statement.ocr_text) > 100  # Should have substantial text
-            
-            # Cleanup test file
-            if os.path.exists(statement.file_path):
-                os.remove(statement.file_path)
-
-    @pytest.mark.asyncio
-    async def test_upload_bank_statement_2_success(self, setup_database):
-        """Test upload with bank-statement-2.pdf (the working one)"""
-        pdf_path = "tests/sample_data/bank-statement-2.pdf"
-        
-        if not os.path.exists(pdf_path):
-            pytest.skip(f"Sample PDF not found: {pdf_path}")
-        
-        with open(pdf_path, "rb") as f:
-            files = {
-                "file": ("bank-statement-2.pdf", f, "application/pdf")
-            }
-            
-            response = client.post("/upload/statement?client_id=1", files=files)
-        
-        assert response.status_code == 201
-        data = response.json()
-        
-        # Verify response structure
-        assert "statement_id" in data
-        assert "pages_processed" in data
-        assert "ocr_preview" in data
-        
-        # Verify OCR worked (bank-statement-2.pdf has 1 page)
-        assert data["pages_processed"] == 1
+        # Verify OCR worked
+        assert data["pages_processed"] == expected_pages
         assert len(data["ocr_preview"]) > 0
-        assert "Bank" in data["ocr_preview"] or "Account" in data["ocr_preview"]
+        assert any(needle in data["ocr_preview"] for needle in needles)
         
         # Verify database record
-        async with TestAsyncSessionLocal() as session:
-            stmt = await session.execute(select(Statement).where(Statement.id == data["statement_id"]))
-            statement = stmt.scalar_one_or_none()
-            assert statement is not None
-            assert statement.ocr_text is not None
+        stmt = await db_session.execute(select(Statement).where(Statement.id == data["statement_id"]))
+        statement = stmt.scalar_one_or_none()
+        assert statement is not None
+        assert statement.client_id == 1
+        assert statement.ocr_text is not None
+        assert len(statement.ocr_text) > min_text_length
             
-            # Cleanup test file
-            if os.path.exists(statement.file_path):
-                os.remove(statement.file_path)
+        # Cleanup test file
+        Path(statement.file_path).unlink(missing_ok=True)
 
     @pytest.mark.asyncio
-    async def test_upload_all_sample_pdfs(self, setup_database):
+    @pytest.mark.skipif(not HAS_SAMPLES, reason="sample PDFs missing")
+    async def test_upload_all_sample_pdfs(self, db_session, async_client, sample_pdfs):
         """Test upload with all available sample PDFs to ensure robustness"""
-        sample_files = [
-            "tests/sample_data/bank-statement-1.pdf",
-            "tests/sample_data/bank-statement-2.pdf", 
-            "tests/sample_data/bank-statement-3.pdf",
-            "tests/sample_data/bank-statement-4.pdf",
-            "tests/sample_data/bank-statement-5.pdf"
-        ]
-        
         successful_uploads = 0
+        statement_ids = []
+        
+        # Uploads run one after another: every request shares the test's session
+        for pdf_name, pdf_bytes in sample_pdfs.items():
+            response = await async_client.post(
+                "/upload/statement?client_id=1",
+                files={"file": (pdf_name, pdf_bytes, "application/pdf")},
+                timeout=120,
+            )
+            
+            assert response.status_code == 201, f"Failed to process {pdf_name}"
+            data = response.json()
+            
+            # Verify OCR extracted some text
+            assert data["pages_processed"] > 0
+            assert len(data["ocr_preview"]) > 0
+            
+            successful_uploads += 1
+            statement_ids.append(data["statement_id"])
         
-        for pdf_path in sample_files:
-            if os.path.exists(pdf_path):
-                with open(pdf_path, "rb") as f:
-                    files = {
-                        "file": (os.path.basename(pdf_path), f, "application/pdf")
-                    }
-                    
-                    response = client.post("/upload/statement?client_id=1", files=files)
-                
-                assert response.status_code == 201, f"Failed to process {pdf_path}"
-                data = response.json()
-                
-                # Verify OCR extracted some text
-                assert data["pages_processed"] > 0
-                assert len(data["ocr_preview"]) > 0
-                
-                successful_uploads += 1
-                
-                # Cleanup test file
-                async with TestAsyncSessionLocal() as session:
-                    stmt = await session.execute(select(Statement).where(Statement.id == data["statement_id"]))
-                    statement = stmt.scalar_one_or_none()
-                    if statement and os.path.exists(statement.file_path):
-                        os.remove(statement.file_path)
+        # Cleanup test files
+        await remove_uploaded_files(db_session, statement_ids)
         
         # Ensure we tested at least one file
         assert successful_uploads > 0, "No sample PDF files found for testing"
 
     @pytest.mark.asyncio
-    async def test_upload_minimal_pdf(self, setup_database):
+    async def test_upload_minimal_pdf(self, db_session, async_client):
         """Test upload with minimal PDF (tests OCR with simple content)"""
-        pdf_content = create_minimal_pdf()
-        
         files = {
-            "file": ("minimal.pdf", io.BytesIO(pdf_content), "application/pdf")
+            "file": ("minimal.pdf", io.BytesIO(DUMMY_PDF_BYTES), "application/pdf")
         }
         
-        response = client.post("/upload/statement?client_id=1", files=files)
+        response = await async_client.post("/upload/statement?client_id=1", files=files)
         
         assert response.status_code == 201
         data = response.json()
@@ -252,11 +257,7 @@ class TestUploadWithOCR:
         assert data["pages_processed"] >= 0
         
         # Cleanup test file
-        async with TestAsyncSessionLocal() as session:
-            stmt = await session.execute(select(Statement).where(Statement.id == data["statement_id"]))
-            statement = stmt.scalar_one_or_none()
-            if statement and os.path.exists(statement.file_path):
-                os.remove(statement.file_path)
+        await remove_uploaded_files(db_session, [data["statement_id"]])
 
     def test_upload_invalid_mime_type(self):
         """Test upload with invalid MIME type"""
@@ -271,16 +272,15 @@ class TestUploadWithOCR:
         assert response.status_code == 400
         assert "Only PDF files are allowed" in response.json()["detail"]
 
-    def test_upload_large_file(self):
+    def test_upload_large_file(self, large_pdf_path):
         """Test upload with file larger than 10MB"""
-        # Create a large file (11MB)
-        large_content = b"a" * (11 * 1024 * 1024)
-        
-        files = {
-            "file": ("large_file.pdf", io.BytesIO(large_content), "application/pdf")
-        }
-        
-        response = client.post("/upload/statement?client_id=1", files=files)
+        # Stream the sparse file straight from its file handle
+        with open(large_pdf_path, "rb") as large_content:
+            files = {
+                "file": ("large_file.pdf", large_content, "application/pdf")
+            }
+            
+            response = client.post("/upload/statement?client_id=1", files=files)
         
         assert response.status_code == 400
         assert "File size must be ≤10 MB" in response.json()["detail"]
@@ -293,9 +293,8 @@ class TestUploadWithOCR:
 
     def test_upload_missing_client_id(self):
         """Test upload without providing client_id"""
-        pdf_content = create_minimal_pdf()
         files = {
-            "file": ("test.pdf", io.BytesIO(pdf_content), "application/pdf")
+            "file": ("test.pdf", io.BytesIO(DUMMY_PDF_BYTES), "application/pdf")
         }
         
         response = client.post("/upload/statement", files=files)
@@ -303,20 +302,19 @@ class TestUploadWithOCR:
         assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
-    async def test_upload_invalid_client_id(self, setup_database):
+    async def test_upload_invalid_client_id(self, db_session, async_client):
         """Test upload with non-existent client_id"""
-        pdf_content = create_minimal_pdf()
         files = {
-            "file": ("test.pdf", io.BytesIO(pdf_content), "application/pdf")
+            "file": ("test.pdf", io.BytesIO(DUMMY_PDF_BYTES), "application/pdf")
         }
         
-        response = client.post("/upload/statement?client_id=999", files=files)
+        response = await async_client.post("/upload/statement?client_id=999", files=files)
         
         assert response.status_code == 404
         assert "Client with ID 999 not found" in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_upload_corrupted_pdf(self, setup_database):
+    async def test_upload_corrupted_pdf(self, db_session, async_client):
         """Test upload with corrupted PDF file"""
         corrupted_content = b"This is corrupted PDF content"
         
@@ -324,66 +322,30 @@ class TestUploadWithOCR:
             "file": ("corrupted.pdf", io.BytesIO(corrupted_content), "application/pdf")
         }
         
-        response = client.post("/upload/statement?client_id=1", files=files)
+        response = await async_client.post("/upload/statement?client_id=1", files=files)
         
         # Should return 500 due to OCR processing failure
         assert response.status_code == 500
         assert "All extraction methods failed" in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_upload_creates_directory(self, setup_database):
+    async def test_upload_creates_directory(self, db_session, async_client, upload_dir):
         """Test that upload creates the uploads directory if it doesn't exist"""
-        # Remove directory if it exists
-        if os.path.exists("data/uploads"):
-            import shutil
-            shutil.rmtree("data/uploads")
+        # Remove the session's temporary uploads directory
+        shutil.rmtree(upload_dir)
         
-        pdf_content = create_minimal_pdf()
         files = {
-            "file": ("test.pdf", io.BytesIO(pdf_content), "application/pdf")
+            "file": ("test.pdf", io.BytesIO(DUMMY_PDF_BYTES), "application/pdf")
         }
         
-        response = client.post("/upload/statement?client_id=1", files=files)
+        response = await async_client.post("/upload/statement?client_id=1", files=files)
         
         assert response.status_code == 201
-        assert os.path.exists("data/uploads")
+        assert upload_dir.is_dir()
         
         # Cleanup
         data = response.json()
-        async with TestAsyncSessionLocal() as session:
-            stmt = await session.execute(select(Statement).where(Statement.id == data["statement_id"]))
-            statement = stmt.scalar_one_or_none()
-            if statement and os.path.exists(statement.file_path):
-                os.remove(statement.file_path)
-
-    @pytest.mark.asyncio 
-    async def test_memory_efficiency_large_pdf(self, setup_database):
-        """Test that our memory fixes handle large PDFs without crashing"""
-        # Test with the previously problematic bank-statement-1.pdf
-        pdf_path = "tests/sample_data/bank-statement-1.pdf"
-        
-        if not os.path.exists(pdf_path):
-            pytest.skip(f"Sample PDF not found: {pdf_path}")
-        
-        # This should not crash or timeout
-        with open(pdf_path, "rb") as f:
-            files = {
-                "file": ("bank-statement-1.pdf", f, "application/pdf")
-            }
-            
-            response = client.post("/upload/statement?client_id=1", files=files, timeout=120)
-        
-        # Should succeed without memory issues
-        assert response.status_code == 201
-        data = response.json()
-        assert data["pages_processed"] > 0
-        
-        # Cleanup
-        async with TestAsyncSessionLocal() as session:
-            stmt = await session.execute(select(Statement).where(Statement.id == data["statement_id"]))
-            statement = stmt.scalar_one_or_none()
-            if statement and os.path.exists(statement.file_path):
-                os.remove(statement.file_path)
+        await remove_uploaded_files(db_session, [data["statement_id"]])
 
 
 class TestUploadEndpointBasics: